@@ -61,9 +61,9 @@ app.add_middleware(RateLimitMiddleware)
 # Request timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
@@ -83,7 +83,7 @@ async def custom_http_exception_handler(request: Request, exc: CustomHTTPExcepti
 
 @app.exception_handler(500)
 async def internal_server_error_handler(request: Request, exc: Exception):
-    logger.error(f"Internal server error: {exc}", exc_info=True)
+    logger.error("Internal server error: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={
@@ -13,13 +13,11 @@ Key Components:
 """
 
 from typing import TypedDict, Annotated, List, Dict, Any, Optional
-from typing_extensions import Literal
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from langchain_core.language_models import BaseChatModel
-from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
-from langchain_community.tools.tavily_search import TavilySearchResults
 import operator
+import functools
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from datetime import datetime
 import logging
 import os
@@ -97,7 +95,7 @@ class FrontendAgent:
         - Responsive design principles
         """
         
-        logger.info(f"Frontend Agent initialized with model: {model_name}")
+        logger.info("Frontend Agent initialized with model: %s", model_name)
     
     def analyze_frontend_requirements(self, requirements: str) -> Dict[str, Any]:
         """
@@ -146,7 +144,7 @@ class FrontendAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error analyzing frontend requirements: {str(e)}")
+            logger.error("Error analyzing frontend requirements: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -190,7 +188,7 @@ class FrontendAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating project structure: {str(e)}")
+            logger.error("Error generating project structure: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -233,7 +231,7 @@ class FrontendAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating Web3 components: {str(e)}")
+            logger.error("Error generating Web3 components: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -275,7 +273,7 @@ class FrontendAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating UI components: {str(e)}")
+            logger.error("Error generating UI components: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -283,6 +281,12 @@ class FrontendAgent:
             }
 
 
+@functools.lru_cache(maxsize=None)
+def get_frontend_agent(model_name: str = "gpt-4o") -> FrontendAgent:
+    """Return the shared FrontendAgent for a model, creating it on first use."""
+    return FrontendAgent(model_name=model_name)
+
+
 def frontend_agent_node(state: FrontendWorkflowState) -> FrontendWorkflowState:
     """
     Frontend agent node for processing frontend development tasks.
@@ -294,7 +298,7 @@ def frontend_agent_node(state: FrontendWorkflowState) -> FrontendWorkflowState:
         Updated workflow state with frontend development results
     """
     try:
-        agent = FrontendAgent()
+        agent = get_frontend_agent()
         
         # Extract the latest message for processing
         if state["messages"]:
@@ -303,14 +307,19 @@ def frontend_agent_node(state: FrontendWorkflowState) -> FrontendWorkflowState:
         else:
             task_description = "Generate a modern Web3-enabled frontend application"
         
-        # Analyze requirements
-        analysis_result = agent.analyze_frontend_requirements(task_description)
-        
-        # Generate project structure
-        structure_result = agent.generate_project_structure(analysis_result)
-        
-        # Generate Web3 components if needed
-        web3_result = agent.generate_web3_components(state.get("web3_requirements", {}))
+        # Web3 components only depend on the requested requirements, so they are
+        # generated while the analysis and project structure run in sequence
+        with ContextThreadPoolExecutor(max_workers=1) as executor:
+            # Generate Web3 components if needed
+            web3_future = executor.submit(agent.generate_web3_components, state.get("web3_requirements", {}))
+            
+            # Analyze requirements
+            analysis_result = agent.analyze_frontend_requirements(task_description)
+            
+            # Generate project structure
+            structure_result = agent.generate_project_structure(analysis_result)
+            
+            web3_result = web3_future.result()
         
         # Create result message
         result_message = AIMessage(
@@ -343,7 +352,7 @@ def frontend_agent_node(state: FrontendWorkflowState) -> FrontendWorkflowState:
         }
         
     except Exception as e:
-        logger.error(f"Error in frontend agent node: {str(e)}")
+        logger.error("Error in frontend agent node: %s", e)
         error_message = AIMessage(content=f"Frontend agent error: {str(e)}")
         
         return {
@@ -361,6 +370,7 @@ def frontend_agent_node(state: FrontendWorkflowState) -> FrontendWorkflowState:
 
 __all__ = [
     "FrontendAgent",
+    "get_frontend_agent",
     "FrontendWorkflowState",
     "frontend_agent_node"
 ]
\ No newline at end of file
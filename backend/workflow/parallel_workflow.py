@@ -16,21 +16,29 @@ Key Components:
 from typing import Dict, Any, List
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Send
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
 from langchain_anthropic import ChatAnthropic
 from datetime import datetime
 import logging
-import asyncio
+import functools
+import time
 
 # Import supervisor components
-from .supervisor_agent import SupervisorWorkflowState, supervisor_node, should_execute_parallel, should_aggregate_results
+from .supervisor_agent import SupervisorWorkflowState, supervisor_node, should_execute_parallel
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maps each agent to the result data field it contributes and the aggregated bucket it feeds
+AGGREGATION_FIELDS = {
+    "research_agent": ("key_insights", "research_insights"),
+    "analysis_agent": ("constraints", "analysis_findings"),
+    "planning_agent": ("plan_steps", "execution_plans"),
+}
+
 
 class AgentConfig:
     """Configuration for individual agents in the parallel workflow."""
@@ -56,30 +64,26 @@ class ParallelWorkflowExecutor:
     
     def execute_agent_task(self, agent_name: str, task: Dict[str, Any], state: SupervisorWorkflowState) -> Dict[str, Any]:
         """Execute a task for a specific agent with enhanced error handling."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            logger.info(f"Executing task for {agent_name}: {task.get('description', 'No description')}")
+            logger.info("Executing task for %s: %s", agent_name, task.get('description', 'No description'))
             
             # Agent-specific execution logic
-            if agent_name == "research_agent":
-                result = self._execute_research_task(task, state)
-            elif agent_name == "analysis_agent":
-                result = self._execute_analysis_task(task, state)
-            elif agent_name == "planning_agent":
-                result = self._execute_planning_task(task, state)
-            else:
+            handler = self._TASK_HANDLERS.get(agent_name)
+            if handler is None:
                 raise ValueError(f"Unknown agent: {agent_name}")
+            result = handler(self, task, state)
             
             # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             result["execution_time"] = execution_time
             
             self.execution_stats["successful_executions"] += 1
             return result
             
         except Exception as e:
-            logger.error(f"Task execution failed for {agent_name}: {str(e)}")
+            logger.error("Task execution failed for %s: %s", agent_name, e)
             self.execution_stats["failed_executions"] += 1
             
             return {
@@ -88,7 +92,7 @@ class ParallelWorkflowExecutor:
                 "status": "failed",
                 "error": str(e),
                 "timestamp": datetime.now().isoformat(),
-                "execution_time": (datetime.now() - start_time).total_seconds()
+                "execution_time": time.perf_counter() - start_time
             }
         finally:
             self.execution_stats["total_executions"] += 1
@@ -164,8 +168,18 @@ class ParallelWorkflowExecutor:
             "data": planning_data,
             "timestamp": datetime.now().isoformat()
         }
+    
+    # Agent name -> function that executes its task
+    _TASK_HANDLERS = {
+        "research_agent": _execute_research_task,
+        "analysis_agent": _execute_analysis_task,
+        "planning_agent": _execute_planning_task,
+    }
 
 
+# Agent nodes the parallel coordinator is allowed to dispatch to
+PARALLEL_AGENT_NODES = frozenset(ParallelWorkflowExecutor._TASK_HANDLERS)
+
 # Initialize global executor
 workflow_executor = ParallelWorkflowExecutor()
 
@@ -255,9 +269,9 @@ def parallel_coordinator_node(state: SupervisorWorkflowState) -> SupervisorWorkf
     
     for task in state["parallel_tasks"]:
         agent_name = task["agent"]
-        if agent_name in ["research_agent", "analysis_agent", "planning_agent"]:
+        if agent_name in PARALLEL_AGENT_NODES:
             parallel_sends.append(Send(agent_name, state))
-            logger.info(f"Dispatching task {task['id']} to {agent_name}")
+            logger.info("Dispatching task %s to %s", task['id'], agent_name)
     
     coordinator_message = AIMessage(
         content=f"Enhanced coordinator dispatched {len(parallel_sends)} parallel tasks with intelligent routing"
@@ -304,18 +318,10 @@ def result_aggregator_node(state: SupervisorWorkflowState) -> SupervisorWorkflow
         total_execution_time += exec_time
         
         if result["status"] == "completed":
-            agent_type = result["agent"]
-            result_data = result.get("data", {})
-            
-            if agent_type == "research_agent":
-                insights = result_data.get("key_insights", [])
-                aggregated_data["research_insights"].extend(insights)
-            elif agent_type == "analysis_agent":
-                findings = result_data.get("constraints", [])
-                aggregated_data["analysis_findings"].extend(findings)
-            elif agent_type == "planning_agent":
-                plans = result_data.get("plan_steps", [])
-                aggregated_data["execution_plans"].extend(plans)
+            fields = AGGREGATION_FIELDS.get(result["agent"])
+            if fields:
+                data_key, aggregate_key = fields
+                aggregated_data[aggregate_key].extend(result.get("data", {}).get(data_key, []))
     
     # Calculate quality metrics
     if aggregated_data["total_agents"] > 0:
@@ -412,16 +418,25 @@ def create_parallel_supervisor_workflow() -> StateGraph:
     return workflow
 
 
+@functools.lru_cache(maxsize=1)
+def get_compiled_parallel_workflow():
+    """Returns the compiled parallel supervisor workflow, building it on first use.
+
+    The compiled graph holds no per-run state, so a single instance is shared
+    by every invocation instead of rebuilding and recompiling it per request.
+    """
+    return create_parallel_supervisor_workflow().compile()
+
+
 def run_parallel_workflow(task_description: str, **kwargs) -> Dict[str, Any]:
     """Executes the enhanced parallel supervisor workflow."""
-    logger.info(f"Starting enhanced parallel workflow execution for: {task_description}")
+    logger.info("Starting enhanced parallel workflow execution for: %s", task_description)
     
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
-        # Create and compile the enhanced workflow
-        workflow = create_parallel_supervisor_workflow()
-        compiled_workflow = workflow.compile()
+        # Reuse the shared compiled workflow
+        compiled_workflow = get_compiled_parallel_workflow()
         
         # Enhanced initial state
         initial_state = {
@@ -441,15 +456,15 @@ def run_parallel_workflow(task_description: str, **kwargs) -> Dict[str, Any]:
         result = compiled_workflow.invoke(initial_state)
         
         # Calculate total execution time
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         result["total_execution_time"] = execution_time
         
-        logger.info(f"Enhanced parallel workflow completed successfully in {execution_time:.2f}s")
+        logger.info("Enhanced parallel workflow completed successfully in %.2fs", execution_time)
         return result
         
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
-        logger.error(f"Enhanced workflow execution failed after {execution_time:.2f}s: {str(e)}")
+        execution_time = time.perf_counter() - start_time
+        logger.error("Enhanced workflow execution failed after %.2fs: %s", execution_time, e)
         return {
             "error": str(e),
             "status": "failed",
@@ -463,8 +478,7 @@ def visualize_parallel_workflow(output_path: str = "enhanced_parallel_workflow.p
     try:
         logger.info("Generating enhanced workflow visualization")
         
-        workflow = create_parallel_supervisor_workflow()
-        compiled_workflow = workflow.compile()
+        compiled_workflow = get_compiled_parallel_workflow()
         
         # Generate enhanced visualization
         graph_image = compiled_workflow.get_graph().draw_mermaid_png()
@@ -473,11 +487,11 @@ def visualize_parallel_workflow(output_path: str = "enhanced_parallel_workflow.p
         with open(output_path, "wb") as f:
             f.write(graph_image)
         
-        logger.info(f"Enhanced workflow visualization saved as '{output_path}'")
+        logger.info("Enhanced workflow visualization saved as '%s'", output_path)
         return True
         
     except Exception as e:
-        logger.error(f"Enhanced visualization generation failed: {str(e)}")
+        logger.error("Enhanced visualization generation failed: %s", e)
         return False
 
 
@@ -491,6 +505,7 @@ __all__ = [
     "parallel_coordinator_node",
     "result_aggregator_node",
     "create_parallel_supervisor_workflow",
+    "get_compiled_parallel_workflow",
     "run_parallel_workflow",
     "visualize_parallel_workflow"
 ]
\ No newline at end of file
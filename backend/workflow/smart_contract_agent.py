@@ -14,13 +14,11 @@ Key Components:
 """
 
 from typing import TypedDict, Annotated, List, Dict, Any, Optional
-from typing_extensions import Literal
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from langchain_core.language_models import BaseChatModel
-from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
-from langchain_community.tools.tavily_search import TavilySearchResults
 import operator
+import functools
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from datetime import datetime
 import logging
 import os
@@ -104,7 +102,7 @@ class SmartContractAgent:
         - Testnet-only deployment for development
         """
         
-        logger.info(f"Smart Contract Agent initialized with model: {model_name}")
+        logger.info("Smart Contract Agent initialized with model: %s", model_name)
     
     def analyze_contract_requirements(self, requirements: str) -> Dict[str, Any]:
         """
@@ -153,7 +151,7 @@ class SmartContractAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error analyzing contract requirements: {str(e)}")
+            logger.error("Error analyzing contract requirements: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -204,7 +202,7 @@ class SmartContractAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating Solidity contract: {str(e)}")
+            logger.error("Error generating Solidity contract: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -258,7 +256,7 @@ class SmartContractAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating Move contract: {str(e)}")
+            logger.error("Error generating Move contract: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -307,7 +305,7 @@ class SmartContractAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating deployment scripts: {str(e)}")
+            logger.error("Error generating deployment scripts: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -358,7 +356,7 @@ class SmartContractAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating test suite: {str(e)}")
+            logger.error("Error generating test suite: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -366,6 +364,12 @@ class SmartContractAgent:
             }
 
 
+@functools.lru_cache(maxsize=None)
+def get_smart_contract_agent(model_name: str = "gpt-4o") -> SmartContractAgent:
+    """Return the shared SmartContractAgent for a model, creating it on first use."""
+    return SmartContractAgent(model_name=model_name)
+
+
 def smart_contract_agent_node(state: SmartContractWorkflowState) -> SmartContractWorkflowState:
     """
     Smart contract agent node for processing contract development tasks.
@@ -377,7 +381,7 @@ def smart_contract_agent_node(state: SmartContractWorkflowState) -> SmartContrac
         Updated workflow state with smart contract development results
     """
     try:
-        agent = SmartContractAgent()
+        agent = get_smart_contract_agent()
         
         # Extract the latest message for processing
         if state["messages"]:
@@ -391,21 +395,23 @@ def smart_contract_agent_node(state: SmartContractWorkflowState) -> SmartContrac
         
         generated_contracts = []
         
-        # Generate Solidity contract
-        solidity_result = agent.generate_solidity_contract(analysis_result.get("analysis", {}))
-        if solidity_result["status"] == "success":
-            generated_contracts.append(solidity_result)
-        
-        # Generate Move contract for Aptos
-        move_aptos_result = agent.generate_move_contract(analysis_result.get("analysis", {}), "aptos")
-        if move_aptos_result["status"] == "success":
-            generated_contracts.append(move_aptos_result)
-        
-        # Generate deployment scripts
-        deployment_result = agent.generate_deployment_scripts(generated_contracts)
-        
-        # Generate test suite
-        test_result = agent.generate_test_suite(generated_contracts)
+        # The Solidity and Move generations are independent, as are the deployment
+        # scripts and test suite, so each pair is submitted together and awaited
+        with ContextThreadPoolExecutor(max_workers=2) as executor:
+            # Generate Solidity contract and Move contract for Aptos
+            specifications = analysis_result.get("analysis", {})
+            solidity_future = executor.submit(agent.generate_solidity_contract, specifications)
+            move_aptos_future = executor.submit(agent.generate_move_contract, specifications, "aptos")
+            
+            for contract_result in (solidity_future.result(), move_aptos_future.result()):
+                if contract_result["status"] == "success":
+                    generated_contracts.append(contract_result)
+            
+            # Generate deployment scripts and test suite
+            deployment_future = executor.submit(agent.generate_deployment_scripts, generated_contracts)
+            test_future = executor.submit(agent.generate_test_suite, generated_contracts)
+            deployment_result = deployment_future.result()
+            test_result = test_future.result()
         
         # Create result message
         result_message = AIMessage(
@@ -437,7 +443,7 @@ def smart_contract_agent_node(state: SmartContractWorkflowState) -> SmartContrac
         }
         
     except Exception as e:
-        logger.error(f"Error in smart contract agent node: {str(e)}")
+        logger.error("Error in smart contract agent node: %s", e)
         error_message = AIMessage(content=f"Smart contract agent error: {str(e)}")
         
         return {
@@ -455,6 +461,7 @@ def smart_contract_agent_node(state: SmartContractWorkflowState) -> SmartContrac
 
 __all__ = [
     "SmartContractAgent",
+    "get_smart_contract_agent",
     "SmartContractWorkflowState",
     "smart_contract_agent_node"
 ]
\ No newline at end of file
@@ -11,17 +11,19 @@ Key Components:
 - Integration with OpenAI GPT-4o and Tavily search
 """
 
-from typing import TypedDict, Annotated, List, Dict, Any, Optional
-from typing_extensions import Literal
+from typing import TypedDict, Annotated, List, Dict, Any, Optional, Literal
+from langchain_core.caches import InMemoryCache
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from langchain_core.language_models import BaseChatModel
-from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
 from langchain_community.tools.tavily_search import TavilySearchResults
 import operator
+import functools
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from datetime import datetime
 import logging
 import os
+import threading
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -31,6 +33,14 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct analysis prompts kept in the model's response cache
+RESPONSE_CACHE_SIZE = 1024
+
+# Least-recently-used Tavily results kept per query, and how long (seconds) before
+# they are refetched so live web results do not go stale
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL = 15 * 60
+
 
 class SupervisorWorkflowState(TypedDict):
     """Enhanced state definition for supervisor-coordinated workflows."""
@@ -70,11 +80,13 @@ class SupervisorAgent:
         if not self.tavily_api_key:
             raise ValueError("Tavily API key is required. Set TAVILY_API_KEY environment variable.")
         
-        # Initialize GPT-4o model
+        # Initialize GPT-4o model; identical analysis prompts are answered from
+        # an in-process cache instead of a new API call
         self.model = ChatOpenAI(
             model=model_name,
             api_key=self.openai_api_key,
-            temperature=0.1
+            temperature=0.1,
+            cache=InMemoryCache(maxsize=RESPONSE_CACHE_SIZE)
         )
         
         # Initialize Tavily search tool
@@ -86,6 +98,11 @@ class SupervisorAgent:
             api_key=self.tavily_api_key
         )
         
+        # Successful Tavily results keyed by query; searches run on worker
+        # threads, so cache access is serialized through a lock
+        self._search_cache: TTLCache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        self._search_cache_lock = threading.Lock()
+        
         # Supervisor system prompt
         self.system_prompt = """
         You are an advanced AI Supervisor Agent powered by GPT-4o with internet search capabilities.
@@ -108,19 +125,22 @@ class SupervisorAgent:
     
     def analyze_task(self, task_description: str) -> Dict[str, Any]:
         """Analyze a task and determine the best execution strategy."""
-        logger.info(f"Supervisor analyzing task: {task_description}")
+        logger.info("Supervisor analyzing task: %s", task_description)
         
         # Generate search queries for additional context
         search_queries = self._generate_search_queries(task_description)
         
-        # Perform internet research
+        # Perform internet research, submitting every query before collecting
+        # so the Tavily round trips overlap instead of running back to back
         search_results = []
-        for query in search_queries:
-            try:
-                results = self.search_tool.run(query)
-                search_results.extend(results if isinstance(results, list) else [results])
-            except Exception as e:
-                logger.warning(f"Search failed for query '{query}': {str(e)}")
+        with ContextThreadPoolExecutor(max_workers=max(len(search_queries), 1)) as executor:
+            futures = [(query, executor.submit(self._search, query)) for query in search_queries]
+            for query, future in futures:
+                try:
+                    results = future.result()
+                    search_results.extend(results if isinstance(results, list) else [results])
+                except Exception as e:
+                    logger.warning("Search failed for query '%s': %s", query, e)
         
         # Analyze task with search context
         analysis_prompt = f"""
@@ -148,7 +168,7 @@ class SupervisorAgent:
                 "timestamp": datetime.now().isoformat()
             }
         except Exception as e:
-            logger.error(f"Task analysis failed: {str(e)}")
+            logger.error("Task analysis failed: %s", e)
             return {
                 "analysis": f"Analysis failed: {str(e)}",
                 "search_results": search_results,
@@ -200,11 +220,8 @@ class SupervisorAgent:
         if not task_description or len(task_description.strip()) < 10:
             return "insufficient_information"
         
-        # Check if we need additional research
-        if "research" in task_description.lower() or "analyze" in task_description.lower():
-            return "execute_parallel_tasks"
-        
-        # Default to parallel execution for complex tasks
+        # Research/analysis tasks and all other tasks run in parallel alike,
+        # so the description is not scanned for keywords
         return "execute_parallel_tasks"
     
     def validate_results(self, task_results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -233,6 +250,18 @@ class SupervisorAgent:
         
         return validation_summary
     
+    def _search(self, query: str) -> Any:
+        """Run a Tavily search, reusing earlier successful results for the same query."""
+        with self._search_cache_lock:
+            results = self._search_cache.get(query)
+        if results is None:
+            results = self.search_tool.run(query)
+            # Failed searches come back as error strings and are not cached
+            if isinstance(results, list):
+                with self._search_cache_lock:
+                    self._search_cache[query] = results
+        return results
+    
     def _generate_search_queries(self, task_description: str) -> List[str]:
         """Generate relevant search queries for task context."""
         # Extract key terms and generate search queries
@@ -269,25 +298,45 @@ class SupervisorAgent:
         return min(base_score + result_bonus, 1.0)
 
 
+@functools.lru_cache(maxsize=None)
+def get_supervisor_agent(model_name: str = "gpt-4o") -> SupervisorAgent:
+    """Return the shared SupervisorAgent for a model, creating it on first use."""
+    return SupervisorAgent(model_name=model_name)
+
+
 # Supervisor node functions
 def supervisor_node(state: SupervisorWorkflowState) -> SupervisorWorkflowState:
     """Enhanced supervisor node with GPT-4o and search capabilities."""
     logger.info("Enhanced supervisor analyzing task and creating execution plan")
     
-    # Initialize supervisor agent
-    supervisor = SupervisorAgent()
+    # Reuse the shared supervisor agent and its model/search clients
+    supervisor = get_supervisor_agent()
     
     task = state["task_description"]
     
+    # Make execution decision before paying for search and LLM analysis;
+    # should_execute_parallel routes insufficient tasks straight to the end
+    decision = supervisor.make_execution_decision(state)
+    
+    if decision == "insufficient_information":
+        return {
+            "messages": [AIMessage(content="Supervisor skipped analysis: insufficient task description")],
+            "parallel_tasks": [],
+            "supervisor_decision": decision,
+            "search_results": [],
+            "confidence_score": 0.0,
+            "execution_metadata": {
+                "supervisor_timestamp": datetime.now().isoformat(),
+                "total_parallel_tasks": 0
+            }
+        }
+    
     # Analyze task with internet research
     analysis_result = supervisor.analyze_task(task)
     
     # Create parallel tasks based on analysis
     parallel_tasks = supervisor.create_parallel_tasks(task, analysis_result)
     
-    # Make execution decision
-    decision = supervisor.make_execution_decision(state)
-    
     supervisor_message = AIMessage(
         content=f"Enhanced supervisor analyzed task and created {len(parallel_tasks)} parallel tasks with search context"
     )
@@ -317,7 +366,7 @@ def should_execute_parallel(state: SupervisorWorkflowState) -> Literal["parallel
     if decision == "execute_parallel_tasks" and confidence >= 0.3:
         return "parallel_coordinator"
     
-    logger.warning(f"Parallel execution skipped. Decision: {decision}, Confidence: {confidence}")
+    logger.warning("Parallel execution skipped. Decision: %s, Confidence: %s", decision, confidence)
     return "end"
 
 
@@ -333,7 +382,7 @@ def should_aggregate_results(state: SupervisorWorkflowState) -> Literal["result_
     if completed_results >= expected_agents or len(task_results) >= 3:
         return "result_aggregator"
     
-    logger.info(f"Waiting for more results. Completed: {completed_results}, Expected: {expected_agents}")
+    logger.info("Waiting for more results. Completed: %s, Expected: %s", completed_results, expected_agents)
     return "end"
 
 
@@ -341,6 +390,7 @@ def should_aggregate_results(state: SupervisorWorkflowState) -> Literal["result_
 __all__ = [
     "SupervisorAgent",
     "SupervisorWorkflowState", 
+    "get_supervisor_agent",
     "supervisor_node",
     "should_execute_parallel",
     "should_aggregate_results"